@@ -14,8 +14,10 @@ Investment Strategist:
 from typing import Tuple
 from crewai import Agent
 
+from src.agents.llm import create_llm
 from src.agents.tools.finance import FundamentalAnalystTool, CompareStocksTool
 from src.agents.tools.scraper import SentimentSearchTool
+from src.shared.config import settings
 
 
 def create_agents() -> Tuple[Agent, Agent]:
@@ -25,6 +27,11 @@ def create_agents() -> Tuple[Agent, Agent]:
     Returns:
         A tuple containing: quant_agent, strategist_agent
     """
+    llm = create_llm()
+    # Memory embeddings call OpenAI and change the prompts between runs, so
+    # they are disabled while recording or replaying a cassette
+    memory = settings.cassette_mode is None
+
     # Quantatative Analyst Agent
     quant_agent = Agent(
         role="Senior Quantitative Equity Analyst",
@@ -51,7 +58,8 @@ def create_agents() -> Tuple[Agent, Agent]:
             "Undervalued / Fairly Valued / Overvalued."
         ),
         verbose=True,
-        memory=True,
+        memory=memory,
+        llm=llm,
         tools=[
             FundamentalAnalystTool(),
             CompareStocksTool()
@@ -88,7 +96,8 @@ def create_agents() -> Tuple[Agent, Agent]:
             "Your output ends with a decisive recommendation: BUY / HOLD / SELL, plus a concise risk assessment and confidence level."
         ),
         verbose=True,
-        memory=True,
+        memory=memory,
+        llm=llm,
         tools=[
             SentimentSearchTool()
         ],
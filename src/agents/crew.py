@@ -8,23 +8,43 @@ Workflow:
     1. Instantiate the agents and tasks
     2. Configure the CrewAI execution process
     3. Handle the overall agentic workflow instantiation
+    4. Bound the run with a deadline that every tool call respects
+    5. Record or replay all upstream responses when a cassette mode is set
+    6. Start live quote ingestion for the configured watchlist
 """
+from typing import Optional
+
 from crewai import Crew, Process
 
 from src.agents.agents import create_agents
 from src.agents.tasks import create_tasks
+from src.shared.cassette import use_cassette
+from src.shared.config import settings
+from src.shared.deadline import run_deadline
+from src.shared.quotes import get_quote_service
 
 
-def run_financial_crew(ticker: str) -> str:
+def run_financial_crew(ticker: str, deadline_seconds: Optional[float] = None,
+                       cassette: Optional[str] = None) -> str:
     """
     Initialize and execute the financial analysis crews for a specific stock.
 
     Args:
         A stock ticker.
+        deadline_seconds: time budget for the run, defaults to settings.run_deadline_seconds.
+            Tools that hit the deadline return partial results instead of blocking.
+        cassette: name of the cassette to record to / replay from when settings.cassette_mode
+            is set, defaults to the ticker.
 
     Returns:
         A final markdown report generated by the strategist_agent
     """
+    # Keep the watchlist quote buffers warm for the tools, no-op if already running.
+    # Not started while recording / replaying: the tools ignore live quotes then,
+    # and polling would break the zero network guarantee of a replay
+    if settings.quote_watchlist and not settings.cassette_mode:
+        get_quote_service().start()
+
     quant_agent, strategist_agent = create_agents()
 
     # Create tasks
@@ -44,6 +64,7 @@ def run_financial_crew(ticker: str) -> str:
 
     # Start analysis
     print(f"\nStarting financial anlysis for: {ticker}...")
-    result = financial_crew.kickoff()
+    with use_cassette(cassette or ticker.upper()), run_deadline(deadline_seconds):
+        result = financial_crew.kickoff()
 
     return result
@@ -0,0 +1,57 @@
+"""
+LLM factory module.
+
+Builds the LLM shared by the agents. When record/replay is enabled the LLM is
+wrapped so every completion goes through the active cassette, which lets a
+run be replayed without calling OpenAI.
+"""
+
+from typing import Any
+
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+
+from src.shared.cassette import cassette_call
+from src.shared.config import settings
+
+
+class CassetteLLM(BaseLLM):
+    """
+    Wraps a CrewAI LLM and routes its completions through the active cassette.
+
+    Completions are keyed on the model name and the full message list.
+    """
+
+    def __init__(self, llm: BaseLLM):
+        super().__init__(model=llm.model, temperature=getattr(llm, "temperature", None))
+        self.llm = llm
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        # CrewAI sets stop words on the agent's LLM, keep the wrapped LLM in sync
+        self.llm.stop = self.stop
+        return cassette_call(
+            "llm.completion", [self.model, messages],
+            lambda: self.llm.call(messages, *args, **kwargs)
+        )
+
+    def supports_function_calling(self) -> bool:
+        return self.llm.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.llm.get_context_window_size()
+
+
+def create_llm() -> BaseLLM:
+    """
+    Create the LLM used by the agents
+
+    Returns:
+        The configured OpenAI model, wrapped in a CassetteLLM when settings.cassette_mode is set
+    """
+    llm = LLM(model=settings.openai_model_name, api_key=settings.openai_api_key)
+    if settings.cassette_mode:
+        return CassetteLLM(llm)
+    return llm
@@ -11,6 +11,11 @@ It provides:
     (e.g., market cap, P/E ratios, EPS, beta, 52-week range).
 - A performance comparison tool that calculates 12-month percentage
     returns between two equities.
+- Per-call timeouts capped by the run deadline, returning clearly marked
+    partial results instead of blocking the crew.
+- Record / replay of every Yahoo Finance response through the active cassette.
+- Live current price and intraday return / volatility from the quote
+    ingestion service when the ticker is on the watchlist.
 
 The tools are designed for use in multi-agent financial research systems,
 where structured market data must be retrieved, normalized, and passed
@@ -22,6 +27,10 @@ from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 import yfinance as yf
 
+from src.shared.cassette import cassette_call, current_cassette
+from src.shared.deadline import PARTIAL_RESULT_MARKER, DeadlineExceeded, call_timeout, call_with_timeout
+from src.shared.quotes import live_metrics
+
 
 class StockAnalysisInput(BaseModel):
     """
@@ -46,7 +55,7 @@ class CompareStocksInput(BaseModel):
                           description="The second stock ticker symbol to compare")
 
 
-class FundamentalAnalystTool(BaseModel):
+class FundamentalAnalystTool(BaseTool):
     """
     CrewAI Tool that will extract the fundamental metrics for a stock.
 
@@ -69,12 +78,16 @@ class FundamentalAnalystTool(BaseModel):
 
         Returns:
             A stringified JSON dictionary that contains the selected matrics 
-            or an error message if it failes
+            or an error message if it failes. If Yahoo Finance does not answer
+            in time the metrics are reported as N/A and marked as partial.
         """
         try:
             # Initialize the tocker object .info will hold stock info in a dictionary
             stock = yf.Ticker(ticker)
-            info: Dict[str, Any] = stock.info
+            info: Dict[str, Any] = cassette_call(
+                "yf.ticker.info", [ticker],
+                lambda: call_with_timeout(lambda: stock.info)
+            )
 
             # Select only the metrics we want for sending to the LLM
             metrics = {
@@ -91,20 +104,48 @@ class FundamentalAnalystTool(BaseModel):
                 "Analyst Recommendation": info.get("recommendationKey", "none")
             }
 
+            # Prefer the live quote buffer, skipped while recording / replaying to keep runs deterministic
+            live = live_metrics(ticker) if current_cassette() is None else None
+            if live:
+                metrics.update(self._live_fields(live, info.get("previousClose")))
+
             return str(metrics)
 
+        except DeadlineExceeded as e:
+            live = live_metrics(ticker) if current_cassette() is None else None
+            if live:
+                return (f"{PARTIAL_RESULT_MARKER} Fundamental data for '{ticker.upper()}' is unavailable, "
+                        f"Yahoo Finance did not respond in time ({e}). Only live quote data is available, "
+                        f"treat all other metrics as N/A: {self._live_fields(live)}")
+            return (f"{PARTIAL_RESULT_MARKER} Fundamental data for '{ticker.upper()}' is unavailable, "
+                    f"Yahoo Finance did not respond in time ({e}). Treat all metrics as N/A.")
+
         except Exception as e:
             return f"Error fetching fundamental data from Yahoo Finance for '{ticker}': str{e}"
 
+    @staticmethod
+    def _live_fields(live: Dict[str, float], previous_close: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Formats the live quote metrics for the LLM, labelled with how each one is computed
+        """
+        fields: Dict[str, Any] = {"Current Price": round(live["price"], 4)}
+        if previous_close:
+            fields["Change vs Previous Close %"] = round((live["price"] / previous_close - 1) * 100, 4)
+        if "return_since_first_pct" in live:
+            fields["Return Since First Quote Today %"] = round(live["return_since_first_pct"], 4)
+            fields["Realized Intraday Volatility % (sqrt of sum of squared log returns)"] = round(
+                live["realized_volatility_pct"], 4)
+        return fields
+
 
-class CompareStocksTool(BaseModel):
+class CompareStocksTool(BaseTool):
     """
     CrewAI tool that will calculate the relative performance between two assets.
 
     E.g. - which stock performed better over a 12 month period expressed in percent change in price.
     """
     name: str = "Compare Stock Performance"
-    decription: str = ("Compares the historical performance of two stocks over the previous 365 days. \
+    description: str = ("Compares the historical performance of two stocks over the previous 365 days. \
                        Returns the percentage gain or loss for both assets.")
 
     args_schema: Type[BaseModel] = CompareStocksInput
@@ -117,7 +158,11 @@ class CompareStocksTool(BaseModel):
         """
         try:
             tickers = f"{ticker_a} {ticker_b}"
-            data = yf.download(tickers, period="1y", progress=False)['Close']
+            data = cassette_call(
+                "yf.download", [tickers, "1y"],
+                lambda: call_with_timeout(
+                    yf.download, tickers, period="1y", progress=False, timeout=call_timeout())
+            )['Close']
 
             # Helper function to calculate the overall return
             def calculate_return(symbol: str) -> float:
@@ -130,7 +175,13 @@ class CompareStocksTool(BaseModel):
             perf_a = calculate_return(ticker_a)
             perf_b = calculate_return(ticker_b)
 
-            return (f"Performance Comparison (Previous 12 months)")
+            return (f"Performance Comparison (Previous 12 months)\n"
+                    f"{ticker_a}: {perf_a:.2f}%\n"
+                    f"{ticker_b}: {perf_b:.2f}%")
+
+        except DeadlineExceeded as e:
+            return (f"{PARTIAL_RESULT_MARKER} Performance comparison for '{ticker_a}' and '{ticker_b}' "
+                    f"is unavailable, Yahoo Finance did not respond in time ({e}).")
 
         except Exception as e:
             return f"Error comparing stocks: '{ticker_a}' and '{ticker_b}': str{e}"
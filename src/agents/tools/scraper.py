@@ -9,6 +9,9 @@ It enables:
 - Structured query validation via Pydantic models.
 - Retrieval of recent stock news, analyst commentary, and market sentiment.
 - Extraction of full-page content in Markdown format for downstream analysis.
+- Hedged page scrapes: more pages are scraped than needed and whichever
+    finish first are kept, so one slow page cannot stall the crew.
+- Record / replay of the search payload through the active cassette.
 
 Designed for integration into multi-agent financial systems where
 qualitative market signals complement quantitative data to support
@@ -16,12 +19,17 @@ investment research and decision-making workflows.
 """
 
 
-from typing import Type
+from typing import Any, Dict, List, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 from firecrawl import FireCrawlApp
 
+from src.shared.cassette import cassette_call
 from src.shared.config import settings
+from src.shared.deadline import PARTIAL_RESULT_MARKER, DeadlineExceeded, call_timeout, call_with_timeout, first_completed
+
+# Number of scraped articles returned to the agent
+RESULTS_LIMIT = 3
 
 
 class FireCrawlSearchInput(BaseModel):
@@ -50,6 +58,11 @@ class SentimentSearchTool(BaseTool):
         """
         Executes a search using the Firecrawl API.
 
+        The search itself only returns links. The pages are then scraped
+        concurrently (hedged with a few extra results) and the first
+        RESULTS_LIMIT pages to finish are returned in search rank order. If fewer pages finish
+        before the timeout, the output is marked as a partial result.
+
         Args: 
             query: (str): the search topic
 
@@ -60,15 +73,80 @@ class SentimentSearchTool(BaseTool):
             return "Error: Firecrawl API key not loaded from src.shared.config"
 
         try:
-            app = FireCrawlApp(api_key=settings.firecrawl_api_key)
-            # Perfoem web search: limit results to 3, return in markdown
-            results = app.search(
-                query=query,
-                limit=3,
-                scrape_options={"formats": ["markdown"]}
+            payload = cassette_call(
+                "firecrawl.search", [query, RESULTS_LIMIT],
+                lambda: self._search(query)
             )
+            pages = payload["pages"]
+
+            if len(pages) < min(RESULTS_LIMIT, payload["links"]):
+                return (f"{PARTIAL_RESULT_MARKER} Only {len(pages)} of {RESULTS_LIMIT} pages were scraped "
+                        f"in time ({payload['failed']} failed).\n{pages}")
+
+            return str(pages)
 
-            return str(results)
+        except DeadlineExceeded as e:
+            return f"{PARTIAL_RESULT_MARKER} Firecrawl search did not respond in time: {e}"
 
         except Exception as e:
             return f"Error executing the Firecrawl search: str{e}"
+
+    def _search(self, query: str) -> Dict[str, Any]:
+        """
+        Runs the Firecrawl search and the hedged page scrapes.
+
+        Returns:
+            A dict with the scraped pages, the number of links found and the number of failed scrapes
+        """
+        app = FireCrawlApp(api_key=settings.firecrawl_api_key)
+        # Perfoem web search: over-fetch links so the scrapes can be hedged
+        results = call_with_timeout(
+            app.search,
+            query=query,
+            limit=RESULTS_LIMIT + settings.firecrawl_hedge_pages,
+            timeout=int(call_timeout() * 1000)
+        )
+
+        links = self._extract_links(results)
+        pages, failed = first_completed(
+            [lambda link=link: self._scrape_page(app, link) for link in links],
+            n=RESULTS_LIMIT
+        )
+
+        return {"pages": pages, "links": len(links), "failed": failed}
+
+    @staticmethod
+    def _extract_links(results: Any) -> List[Dict[str, Any]]:
+        """
+        Normalizes the Firecrawl search response into a list of dicts with url, title and description
+        """
+        items = getattr(results, "data", None) or getattr(results, "web", None) or results or []
+        if isinstance(items, dict):
+            items = items.get("data") or items.get("web") or []
+
+        links = []
+        for item in items:
+            if not isinstance(item, dict):
+                item = item.model_dump() if hasattr(item, "model_dump") else vars(item)
+            if item.get("url"):
+                links.append({
+                    "url": item["url"],
+                    "title": item.get("title"),
+                    "description": item.get("description")
+                })
+        return links
+
+    @staticmethod
+    def _scrape_page(app: FireCrawlApp, link: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Scrapes a single search result page as markdown.
+
+        Firecrawl takes the timeout in milliseconds, so a losing hedged scrape
+        stops on its own once the run can no longer use it.
+        """
+        page = app.scrape_url(
+            link["url"], formats=["markdown"], timeout=int(call_timeout() * 1000))
+        markdown = getattr(page, "markdown", None)
+        if markdown is None and isinstance(page, dict):
+            markdown = page.get("markdown")
+        return {**link, "markdown": markdown}
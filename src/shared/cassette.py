@@ -0,0 +1,176 @@
+"""
+Cassette Record / Replay Module
+
+Captures every upstream response (Yahoo Finance, Firecrawl, LLM completions)
+made during a crew run into a local cassette, and serves them back from disk
+with zero network on later runs.
+
+Modes (settings.cassette_mode):
+    None: calls pass straight through, nothing is stored
+    "record": calls are executed and their responses written to the cassette
+    "replay": responses are read from the cassette, the upstream is never called
+
+Each response is stored as a gzip compressed pickle under
+<settings.cassette_dir>/<cassette name>/, keyed by a hash of the call kind and
+its arguments. Identical calls made several times in one run are stored in
+sequence so a replay returns them in the same order. Calls that raise are
+recorded too, and the same exception is raised again on replay. Recording
+into an existing cassette replaces its previous contents.
+"""
+
+import contextvars
+import gzip
+import hashlib
+import json
+import pickle
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+from src.shared.config import settings
+
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class CassetteMiss(KeyError):
+    """
+    Raised in replay mode when no recorded response exists for a call
+    """
+
+
+class Cassette:
+    """
+    A named set of recorded responses stored on disk.
+
+    Args:
+        name: cassette name, used as the directory name (e.g. the ticker)
+        mode: RECORD or REPLAY
+        root: base directory for all cassettes
+    """
+
+    def __init__(self, name: str, mode: str, root: Optional[str] = None):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(
+                f"Invalid cassette mode '{mode}', expected '{RECORD}' or '{REPLAY}'")
+
+        self.name = name
+        self.mode = mode
+        self.path = Path(root or settings.cassette_dir) / name
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == RECORD:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # Start from an empty cassette so responses left by an earlier, longer
+            # recording cannot be replayed as part of this one
+            for file in self.path.glob("*.pkl.gz"):
+                file.unlink()
+
+    @staticmethod
+    def make_key(kind: str, args: Sequence[Any]) -> str:
+        """
+        Builds a stable key from the call kind and its arguments
+        """
+        payload = json.dumps([kind, list(args)], sort_keys=True, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+        return f"{kind}-{digest}"
+
+    def _next_file(self, key: str) -> Path:
+        # Repeated identical calls are numbered in the order they are made
+        with self._lock:
+            index = self._counts.get(key, 0)
+            self._counts[key] = index + 1
+        return self.path / f"{key}-{index}.pkl.gz"
+
+    def call(self, kind: str, args: Sequence[Any], fn: Callable[[], Any]) -> Any:
+        """
+        Records or replays a single upstream call.
+
+        Args:
+            kind: name of the upstream call (e.g. "yf.ticker.info")
+            args: arguments identifying the call, must be JSON serializable or str-able
+            fn: zero-argument callable that performs the real call
+
+        Raises:
+            CassetteMiss: replay mode and the call was never recorded, or was
+                made more often than it was recorded
+            Exception: whatever the recorded call raised
+        """
+        key = self.make_key(kind, args)
+        file = self._next_file(key)
+
+        if self.mode == REPLAY:
+            if not file.exists():
+                raise CassetteMiss(
+                    f"No recorded response for {kind} ({file.name}) in cassette '{self.name}'")
+            with gzip.open(file, "rb") as f:
+                outcome, value = pickle.load(f)
+            if outcome == "error":
+                raise value
+            return value
+
+        try:
+            response = fn()
+        except Exception as e:
+            self._write(file, ("error", e))
+            raise
+
+        self._write(file, ("response", response))
+        return response
+
+    @staticmethod
+    def _write(file: Path, record: Tuple[str, Any]) -> None:
+        outcome, value = record
+        try:
+            payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            if outcome != "error":
+                raise
+            # Some exceptions do not pickle, keep their type name and message instead
+            payload = pickle.dumps(
+                (outcome, RuntimeError(f"{type(value).__name__}: {value}")),
+                protocol=pickle.HIGHEST_PROTOCOL)
+        with gzip.open(file, "wb") as f:
+            f.write(payload)
+
+
+_current_cassette: contextvars.ContextVar[Optional[Cassette]] = contextvars.ContextVar(
+    "current_cassette", default=None)
+
+
+def current_cassette() -> Optional[Cassette]:
+    """
+    Returns the cassette of the active run, or None when record/replay is off
+    """
+    return _current_cassette.get()
+
+
+@contextmanager
+def use_cassette(name: str, mode: Optional[str] = None) -> Iterator[Optional[Cassette]]:
+    """
+    Activates a cassette for everything executed inside the with block.
+
+    Args:
+        name: cassette name
+        mode: RECORD, REPLAY or None, defaults to settings.cassette_mode
+    """
+    mode = mode if mode is not None else settings.cassette_mode
+    cassette = Cassette(name, mode) if mode else None
+    token = _current_cassette.set(cassette)
+    try:
+        yield cassette
+    finally:
+        _current_cassette.reset(token)
+
+
+def cassette_call(kind: str, args: Sequence[Any], fn: Callable[[], Any]) -> Any:
+    """
+    Routes an upstream call through the active cassette, or calls it directly if there is none
+    """
+    cassette = current_cassette()
+    if cassette is None:
+        return fn()
+    return cassette.call(kind, args, fn)
@@ -5,9 +5,9 @@ Use Pydantic to safely load and validate data from .env for application use
 """
 
 from functools import lru_cache
-from typing import Optional
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field
+from typing import Annotated, List, Literal, Optional
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+from pydantic import Field, field_validator
 
 
 class Settings(BaseSettings):
@@ -20,6 +20,16 @@ class Settings(BaseSettings):
         firecrawl_api_key
         langchain_api_key
         langchain_tracing_v2
+        run_deadline_seconds
+        tool_timeout_seconds
+        firecrawl_hedge_pages
+        cassette_mode
+        cassette_dir
+        quote_watchlist
+        quote_feed
+        quote_poll_interval_seconds
+        quote_max_age_seconds
+        quote_buffer_size
     """
     openai_api_key: str = Field(..., description="OpenAI API Key")
     openai_model_name: str = Field(
@@ -37,10 +47,52 @@ class Settings(BaseSettings):
     azure_blob_storage_connection_string: Optional[str] = Field(
         None, description="Connection string for Azure Blob Storage Container")
 
+    run_deadline_seconds: float = Field(
+        300.0, description="Overall time budget for a single crew run")
+    tool_timeout_seconds: float = Field(
+        20.0, description="Timeout for a single upstream call made by a tool")
+    firecrawl_hedge_pages: int = Field(
+        2, description="Extra pages scraped beyond the number of results needed")
+
+    cassette_mode: Optional[Literal["record", "replay"]] = Field(
+        None, description="Record or replay all upstream responses to/from a local cassette")
+    cassette_dir: str = Field(
+        "cassettes", description="Directory where cassettes are stored")
+
+    quote_watchlist: Annotated[List[str], NoDecode] = Field(
+        default_factory=list,
+        description="Tickers polled by the live quote ingestion service (e.g. QUOTE_WATCHLIST=AAPL,MSFT)")
+    quote_feed: Literal["yahoo", "simulated"] = Field(
+        "yahoo", description="Quote source for the ingestion service, 'simulated' needs no network")
+    quote_poll_interval_seconds: float = Field(
+        60.0, description="Seconds between live quote polls, Yahoo quotes are 1-minute bars")
+    quote_max_age_seconds: float = Field(
+        180.0, description="Age of the latest quote after which tools ignore it as stale")
+    quote_buffer_size: int = Field(
+        4096, description="Number of quotes kept in memory per ticker")
+
     # Pydantic configuration
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
+    @field_validator("cassette_mode", mode="before")
+    @classmethod
+    def empty_cassette_mode_is_off(cls, value):
+        """
+        Treats an empty CASSETTE_MODE= in the .env as record/replay turned off
+        """
+        return value or None
+
+    @field_validator("quote_watchlist", mode="before")
+    @classmethod
+    def split_quote_watchlist(cls, value):
+        """
+        Accepts the watchlist as a comma separated string as well as a list
+        """
+        if isinstance(value, str):
+            return [ticker.strip().upper() for ticker in value.split(",") if ticker.strip()]
+        return value
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -0,0 +1,196 @@
+"""
+Deadline Propagation Module
+
+Carries a per-run deadline from the crew entry point down into every tool call
+so that a single slow upstream (a hung yf.download, a slow Firecrawl scrape)
+cannot hold the whole sequential crew past its SLA.
+
+It provides:
+
+- A Deadline object and a context-local "current deadline" for the active run.
+- call_with_timeout: runs a blocking call with a timeout capped by the run deadline.
+- first_completed: hedges several blocking calls and keeps whichever N finish first.
+
+Tools catch DeadlineExceeded and return a clearly marked partial result instead
+of blocking, so the agents can still produce a report.
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.shared.config import settings
+
+
+# Marker prepended to every tool output that was cut short by a timeout
+PARTIAL_RESULT_MARKER = "[PARTIAL RESULT]"
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised when a tool call does not finish within its timeout or the run deadline
+    """
+
+
+class Deadline:
+    """
+    Absolute point in time by which the current run must finish.
+
+    Uses the monotonic clock so wall clock adjustments do not affect it.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """
+        Seconds left before the deadline, never negative
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "current_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """
+    Returns the deadline of the active run, or None outside of a run
+    """
+    return _current_deadline.get()
+
+
+@contextmanager
+def run_deadline(seconds: Optional[float] = None) -> Iterator[Deadline]:
+    """
+    Sets the deadline for everything executed inside the with block.
+
+    Args:
+        seconds: run budget, defaults to settings.run_deadline_seconds
+    """
+    deadline = Deadline(
+        seconds if seconds is not None else settings.run_deadline_seconds)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def call_timeout(timeout: Optional[float] = None) -> float:
+    """
+    Resolves the timeout for a single call.
+
+    The per-call timeout (default settings.tool_timeout_seconds) is capped
+    by whatever is left of the run deadline.
+    """
+    timeout = timeout if timeout is not None else settings.tool_timeout_seconds
+    deadline = current_deadline()
+    if deadline is not None:
+        timeout = min(timeout, deadline.remaining())
+    return timeout
+
+
+def _submit(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """
+    Runs a call on its own daemon thread.
+
+    Calls such as yf.Ticker.info cannot be given a timeout, so a timed out call
+    is abandoned rather than killed. A thread per call (instead of a shared pool)
+    means an abandoned call can never starve later ones, and daemon threads do
+    not block interpreter exit.
+    """
+    future: Future = Future()
+    # Copy the context so nested calls inside the worker still see the deadline
+    ctx = contextvars.copy_context()
+
+    def worker() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(ctx.run(fn, *args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=worker, name="tool-call", daemon=True).start()
+    return future
+
+
+def call_with_timeout(fn: Callable[..., Any], *args: Any,
+                      max_wait: Optional[float] = None, **kwargs: Any) -> Any:
+    """
+    Runs a blocking call and waits at most call_timeout(max_wait) seconds for it.
+
+    All other arguments, including a timeout keyword, are passed to fn.
+    Upstream calls that accept their own timeout should be given
+    call_timeout(), so the abandoned worker finishes shortly after.
+
+    Raises:
+        DeadlineExceeded: the call did not finish in time (or no time was left)
+    """
+    timeout = call_timeout(max_wait)
+    if timeout <= 0:
+        raise DeadlineExceeded("Run deadline already exceeded")
+
+    future = _submit(fn, *args, **kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise DeadlineExceeded(
+            f"Call to {getattr(fn, '__name__', fn)} timed out after {timeout:.1f}s")
+
+
+def first_completed(calls: Sequence[Callable[[], Any]], n: int,
+                    timeout: Optional[float] = None) -> Tuple[List[Any], int]:
+    """
+    Hedges several blocking calls and keeps the first n that succeed.
+
+    All calls are started at once. Results are collected until n have
+    succeeded, every call has finished, or the timeout expires. Failed calls
+    are skipped, slower calls are abandoned, so each call should carry its own
+    upstream timeout.
+
+    Args:
+        calls: zero-argument callables to run concurrently
+        n: number of successful results wanted
+        timeout: overall wait, capped by the run deadline
+
+    Returns:
+        A tuple of (winning results in the order of calls, number of calls that failed)
+    """
+    timeout = call_timeout(timeout)
+    winners: Dict[int, Any] = {}
+    failed = 0
+    if timeout <= 0 or not calls:
+        return [], failed
+
+    expires_at = time.monotonic() + timeout
+    futures = {_submit(call): index for index, call in enumerate(calls)}
+    pending = set(futures)
+
+    while pending and len(winners) < n:
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining,
+                             return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is not None:
+                failed += 1
+            elif len(winners) < n:
+                winners[futures[future]] = future.result()
+
+    for future in pending:
+        future.cancel()
+
+    return [winners[index] for index in sorted(winners)], failed
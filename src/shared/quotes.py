@@ -0,0 +1,350 @@
+"""
+Live Quote Ingestion Module
+
+Polls quotes for a subscribed watchlist in a background thread and keeps the
+most recent ones in fixed-size, NumPy backed ring buffers (one per ticker).
+Tools read the latest price and intraday return / volatility straight from
+memory instead of making a Yahoo Finance round trip.
+
+It provides:
+
+- QuoteRingBuffer: fixed capacity timestamp / price buffer with O(1) appends.
+- YahooQuoteFeed: polls last prices from Yahoo Finance.
+- SimulatedQuoteFeed: local random-walk feed for tests and offline runs.
+- QuoteIngestionService: the background poller that fills the buffers.
+
+The feed used by the process wide service is picked by settings.quote_feed.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Protocol, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import yfinance as yf
+
+from src.shared.config import settings
+
+
+# Trading days are split on the exchange's local date
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
+
+
+class QuoteRingBuffer:
+    """
+    Fixed-size buffer of (timestamp, price) samples for a single ticker.
+
+    Once full, the oldest samples are overwritten. Timestamps are unix seconds
+    and must be appended in increasing order.
+
+    Args:
+        capacity: maximum number of samples kept
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 2:
+            raise ValueError("Quote buffer capacity must be at least 2")
+
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._prices = np.zeros(capacity, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, price: float) -> None:
+        """
+        Adds a sample, overwriting the oldest one when the buffer is full
+        """
+        with self._lock:
+            self._timestamps[self._head] = timestamp
+            self._prices[self._head] = price
+            self._head = (self._head + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """
+        Returns the most recent (timestamp, price), or None if the buffer is empty
+        """
+        with self._lock:
+            if self._count == 0:
+                return None
+            index = self._head - 1
+            return float(self._timestamps[index]), float(self._prices[index])
+
+    def window(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns copies of the buffered timestamps and prices, oldest first
+        """
+        with self._lock:
+            if self._count < self.capacity:
+                return self._timestamps[:self._count].copy(), self._prices[:self._count].copy()
+            order = np.r_[self._head:self.capacity, 0:self._head]
+            return self._timestamps[order], self._prices[order]
+
+    def intraday(self) -> Optional[Dict[str, float]]:
+        """
+        Computes intraday metrics over the buffered samples of the latest trading day.
+
+        The buffer only holds what was polled, so the first sample of the day is
+        the first quote seen by the service, not necessarily the open.
+
+        Returns:
+            A dict with the latest price, the first buffered price of the day, the
+            return since that first price (%) and the realized volatility over the
+            day (sqrt of the sum of squared log returns, %), or None if there are
+            fewer than two samples for the day
+        """
+        timestamps, prices = self.window()
+        if len(prices) < 2:
+            return None
+
+        last_day = datetime.fromtimestamp(timestamps[-1], MARKET_TIMEZONE)
+        day_start = last_day.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+        prices = prices[np.searchsorted(timestamps, day_start):]
+        if len(prices) < 2:
+            return None
+
+        log_returns = np.diff(np.log(prices))
+        return {
+            "price": float(prices[-1]),
+            "first_price": float(prices[0]),
+            "return_since_first_pct": float((prices[-1] / prices[0] - 1) * 100),
+            "realized_volatility_pct": float(np.sqrt(np.sum(log_returns ** 2)) * 100),
+        }
+
+
+class QuoteFeed(Protocol):
+    """
+    Source of quotes polled by the ingestion service
+    """
+
+    def fetch(self, tickers: List[str]) -> Dict[str, Tuple[float, float]]:
+        """
+        Returns the latest (timestamp, price) for each ticker that has a quote
+        """
+        ...
+
+
+class YahooQuoteFeed:
+    """
+    Polls last traded prices from Yahoo Finance.
+
+    All tickers are fetched in one download of the last few 1-minute bars with
+    an HTTP timeout, so a stalled Yahoo Finance can delay a poll but never leaves
+    threads behind. Each quote carries the timestamp of the bar it came from, so
+    outside market hours no new quotes appear.
+
+    Args:
+        timeout: HTTP timeout in seconds, defaults to settings.tool_timeout_seconds
+        lookback: how far back bars are requested, in minutes
+    """
+
+    def __init__(self, timeout: Optional[float] = None, lookback: int = 10):
+        self.timeout = timeout if timeout is not None else settings.tool_timeout_seconds
+        self.lookback = lookback
+
+    def fetch(self, tickers: List[str]) -> Dict[str, Tuple[float, float]]:
+        start = datetime.now(timezone.utc) - timedelta(minutes=self.lookback)
+        data = yf.download(" ".join(tickers), start=start, interval="1m", progress=False,
+                           threads=False, timeout=self.timeout, multi_level_index=True)
+        if data is None or data.empty:
+            return {}
+
+        closes = data["Close"]
+        quotes = {}
+        for ticker in tickers:
+            if ticker not in closes:
+                continue
+            prices = closes[ticker].dropna()
+            if not prices.empty:
+                quotes[ticker] = (prices.index[-1].timestamp(), float(prices.iloc[-1]))
+        return quotes
+
+
+class SimulatedQuoteFeed:
+    """
+    Local quote feed that moves each price by a random walk on every poll.
+
+    Args:
+        start_prices: starting price per ticker, unknown tickers start at 100
+        volatility: standard deviation of the per-poll log return
+        seed: random seed, makes the generated prices reproducible
+    """
+
+    def __init__(self, start_prices: Optional[Dict[str, float]] = None,
+                 volatility: float = 0.001, seed: Optional[int] = None):
+        self.prices = {t.upper(): p for t, p in (start_prices or {}).items()}
+        self.volatility = volatility
+        self._rng = np.random.default_rng(seed)
+
+    def fetch(self, tickers: List[str]) -> Dict[str, Tuple[float, float]]:
+        now = time.time()
+        shocks = np.exp(self._rng.normal(0.0, self.volatility, len(tickers)))
+        quotes = {}
+        for ticker, shock in zip(tickers, shocks):
+            price = self.prices.get(ticker, 100.0) * float(shock)
+            self.prices[ticker] = price
+            quotes[ticker] = (now, price)
+        return quotes
+
+
+class QuoteIngestionService:
+    """
+    Background poller that feeds quotes for a watchlist into ring buffers.
+
+    Args:
+        feed: quote source, defaults to YahooQuoteFeed
+        interval: seconds between polls, defaults to settings.quote_poll_interval_seconds
+        capacity: samples kept per ticker, defaults to settings.quote_buffer_size
+        max_age: seconds after which the latest quote is considered stale,
+            defaults to settings.quote_max_age_seconds
+    """
+
+    def __init__(self, feed: Optional[QuoteFeed] = None, interval: Optional[float] = None,
+                 capacity: Optional[int] = None, max_age: Optional[float] = None):
+        self.feed = feed or YahooQuoteFeed()
+        self.interval = interval if interval is not None else settings.quote_poll_interval_seconds
+        self.capacity = capacity if capacity is not None else settings.quote_buffer_size
+        self.max_age = max_age if max_age is not None else settings.quote_max_age_seconds
+        self._buffers: Dict[str, QuoteRingBuffer] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, tickers: Iterable[str]) -> None:
+        """
+        Adds tickers to the watchlist
+        """
+        with self._lock:
+            for ticker in tickers:
+                self._buffers.setdefault(ticker.upper(), QuoteRingBuffer(self.capacity))
+
+    def unsubscribe(self, tickers: Iterable[str]) -> None:
+        """
+        Removes tickers from the watchlist and drops their buffers
+        """
+        with self._lock:
+            for ticker in tickers:
+                self._buffers.pop(ticker.upper(), None)
+
+    def watchlist(self) -> List[str]:
+        with self._lock:
+            return list(self._buffers)
+
+    def buffer(self, ticker: str) -> Optional[QuoteRingBuffer]:
+        """
+        Returns the buffer of a subscribed ticker, or None if it is not subscribed
+        """
+        return self._buffers.get(ticker.upper())
+
+    def poll_once(self) -> None:
+        """
+        Fetches one round of quotes and appends them to the buffers.
+
+        A quote is skipped unless it is newer than the latest buffered one, so
+        polling the same bar again (e.g. after the close) adds nothing.
+        """
+        tickers = self.watchlist()
+        if not tickers:
+            return
+
+        for ticker, (timestamp, price) in self.feed.fetch(tickers).items():
+            buffer = self.buffer(ticker)
+            if buffer is None:
+                continue
+            latest = buffer.latest()
+            if latest is None or timestamp > latest[0]:
+                buffer.append(timestamp, price)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                print(f"Error polling quotes: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """
+        Starts the background polling thread, does nothing if it is already running
+        """
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="quote-ingestion", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background polling thread
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def create_quote_feed(name: Optional[str] = None) -> QuoteFeed:
+    """
+    Builds a quote feed by name
+
+    Args:
+        name: "yahoo" or "simulated", defaults to settings.quote_feed
+    """
+    name = name or settings.quote_feed
+    if name == "simulated":
+        return SimulatedQuoteFeed()
+    if name == "yahoo":
+        return YahooQuoteFeed()
+    raise ValueError(f"Unknown quote feed '{name}', expected 'yahoo' or 'simulated'")
+
+
+@lru_cache()
+def get_quote_service() -> QuoteIngestionService:
+    """
+    Creates and caches the process wide quote service.
+
+    It uses the feed from settings.quote_feed and is subscribed to settings.quote_watchlist
+    """
+    service = QuoteIngestionService(feed=create_quote_feed())
+    service.subscribe(settings.quote_watchlist)
+    return service
+
+
+def live_metrics(ticker: str, service: Optional[QuoteIngestionService] = None) -> Optional[Dict[str, float]]:
+    """
+    Reads the latest price and intraday metrics for a ticker from the quote service.
+
+    Quotes are only used while the service is running and the latest one is
+    no older than the service's max_age.
+
+    Args:
+        ticker: stock ticker symbol
+        service: quote service to read from, defaults to get_quote_service()
+
+    Returns:
+        The intraday metrics (or just the latest price when there is not enough
+        history for the day), or None if no fresh quote is buffered
+    """
+    service = service or get_quote_service()
+    buffer = service.buffer(ticker)
+    if not service.running or buffer is None:
+        return None
+
+    latest = buffer.latest()
+    if latest is None or time.time() - latest[0] > service.max_age:
+        return None
+
+    return buffer.intraday() or {"price": latest[1]}
@@ -0,0 +1,11 @@
+"""
+Shared test configuration.
+
+src.shared.config builds the settings at import time, so the required API
+keys are given placeholder values before any src module is imported.
+"""
+
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("FIRECRAWL_API_KEY", "test-firecrawl-key")
@@ -0,0 +1,82 @@
+"""
+Tests for the record / replay cassette store.
+"""
+
+import pytest
+
+from src.shared.cassette import RECORD, REPLAY, Cassette, CassetteMiss, cassette_call, use_cassette
+from src.shared.deadline import DeadlineExceeded
+
+
+def test_replay_returns_recorded_responses_in_order(tmp_path):
+    recorder = Cassette("AAPL", RECORD, root=str(tmp_path))
+    assert recorder.call("llm.completion", ["model", "hi"], lambda: "first") == "first"
+    assert recorder.call("llm.completion", ["model", "hi"], lambda: "second") == "second"
+
+    player = Cassette("AAPL", REPLAY, root=str(tmp_path))
+    assert player.call("llm.completion", ["model", "hi"], pytest.fail) == "first"
+    assert player.call("llm.completion", ["model", "hi"], pytest.fail) == "second"
+
+
+def test_replay_raises_when_call_repeats_more_than_recorded(tmp_path):
+    Cassette("AAPL", RECORD, root=str(tmp_path)).call("yf.ticker.info", ["AAPL"], lambda: {})
+
+    player = Cassette("AAPL", REPLAY, root=str(tmp_path))
+    player.call("yf.ticker.info", ["AAPL"], pytest.fail)
+    with pytest.raises(CassetteMiss):
+        player.call("yf.ticker.info", ["AAPL"], pytest.fail)
+
+
+def test_replay_raises_for_unrecorded_call(tmp_path):
+    Cassette("AAPL", RECORD, root=str(tmp_path))
+    with pytest.raises(CassetteMiss):
+        Cassette("AAPL", REPLAY, root=str(tmp_path)).call("yf.download", ["AAPL SPY"], pytest.fail)
+
+
+def test_recorded_exception_is_raised_again_on_replay(tmp_path):
+    def timed_out():
+        raise DeadlineExceeded("Call to download timed out after 20.0s")
+
+    recorder = Cassette("AAPL", RECORD, root=str(tmp_path))
+    with pytest.raises(DeadlineExceeded):
+        recorder.call("yf.download", ["AAPL SPY"], timed_out)
+
+    player = Cassette("AAPL", REPLAY, root=str(tmp_path))
+    with pytest.raises(DeadlineExceeded, match="timed out after 20.0s"):
+        player.call("yf.download", ["AAPL SPY"], pytest.fail)
+
+
+def test_unpicklable_exception_is_replayed_as_runtime_error(tmp_path):
+    class LocalError(Exception):
+        pass
+
+    def broken():
+        raise LocalError("boom")
+
+    with pytest.raises(LocalError):
+        Cassette("AAPL", RECORD, root=str(tmp_path)).call("firecrawl.search", ["q"], broken)
+
+    with pytest.raises(RuntimeError, match="LocalError: boom"):
+        Cassette("AAPL", REPLAY, root=str(tmp_path)).call("firecrawl.search", ["q"], pytest.fail)
+
+
+def test_cassette_call_passes_through_without_cassette():
+    with use_cassette("AAPL") as cassette:
+        assert cassette is None
+        assert cassette_call("yf.ticker.info", ["AAPL"], lambda: "live") == "live"
+
+
+def test_re_recording_a_shorter_run_replaces_old_responses(tmp_path):
+    recorder = Cassette("AAPL", RECORD, root=str(tmp_path))
+    for response in ("first", "second"):
+        recorder.call("llm.completion", ["model", "hi"], lambda: response)
+    recorder.call("yf.ticker.info", ["AAPL"], lambda: {})
+
+    Cassette("AAPL", RECORD, root=str(tmp_path)).call("llm.completion", ["model", "hi"], lambda: "new")
+
+    player = Cassette("AAPL", REPLAY, root=str(tmp_path))
+    assert player.call("llm.completion", ["model", "hi"], pytest.fail) == "new"
+    with pytest.raises(CassetteMiss):
+        player.call("llm.completion", ["model", "hi"], pytest.fail)
+    with pytest.raises(CassetteMiss):
+        player.call("yf.ticker.info", ["AAPL"], pytest.fail)
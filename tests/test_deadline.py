@@ -0,0 +1,99 @@
+"""
+Tests for deadline propagation, per-call timeouts and hedged calls.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.shared.deadline import (
+    DeadlineExceeded,
+    call_timeout,
+    call_with_timeout,
+    current_deadline,
+    first_completed,
+    run_deadline,
+)
+
+
+def test_run_deadline_is_scoped_to_with_block():
+    assert current_deadline() is None
+    with run_deadline(5) as deadline:
+        assert current_deadline() is deadline
+        assert 0 < deadline.remaining() <= 5
+    assert current_deadline() is None
+
+
+def test_call_timeout_is_capped_by_run_deadline():
+    assert call_timeout(10) == 10
+    with run_deadline(0.5):
+        assert call_timeout(10) <= 0.5
+
+
+def test_call_with_timeout_returns_result():
+    assert call_with_timeout(lambda x: x * 2, 21, max_wait=1) == 42
+
+
+def test_call_with_timeout_passes_timeout_to_the_call():
+    def upstream(query, limit=None, timeout=None):
+        return query, limit, timeout
+
+    assert call_with_timeout(upstream, "q", limit=5, timeout=20000) == ("q", 5, 20000)
+
+
+def test_call_with_timeout_raises_on_timeout():
+    with pytest.raises(DeadlineExceeded):
+        call_with_timeout(time.sleep, 1, max_wait=0.05)
+
+
+def test_call_with_timeout_propagates_errors():
+    with pytest.raises(ZeroDivisionError):
+        call_with_timeout(lambda: 1 / 0, max_wait=1)
+
+
+def test_call_with_timeout_fails_fast_when_deadline_expired():
+    with run_deadline(0):
+        with pytest.raises(DeadlineExceeded):
+            call_with_timeout(lambda: 42, max_wait=1)
+
+
+def test_hung_calls_do_not_starve_later_calls():
+    release = threading.Event()
+    for _ in range(32):
+        with pytest.raises(DeadlineExceeded):
+            call_with_timeout(release.wait, max_wait=0.01)
+
+    assert call_with_timeout(lambda: 42, max_wait=1) == 42
+    release.set()
+
+
+def test_worker_threads_see_the_run_deadline():
+    with run_deadline(5) as deadline:
+        assert call_with_timeout(current_deadline, max_wait=1) is deadline
+
+
+def test_first_completed_keeps_first_n_in_call_order():
+    def slow(value, delay):
+        return lambda: (time.sleep(delay), value)[1]
+
+    calls = [slow("rank-1", 0.2), slow("rank-2", 0.0), slow("rank-3", 5), slow("rank-4", 0.0)]
+    results, failed = first_completed(calls, n=3, timeout=2)
+
+    assert results == ["rank-1", "rank-2", "rank-4"]
+    assert failed == 0
+
+
+def test_first_completed_counts_failures_and_stops_at_timeout():
+    calls = [lambda: 1 / 0, lambda: "ok", lambda: time.sleep(5)]
+    start = time.monotonic()
+    results, failed = first_completed(calls, n=3, timeout=0.2)
+
+    assert results == ["ok"]
+    assert failed == 1
+    assert time.monotonic() - start < 1
+
+
+def test_first_completed_returns_nothing_once_deadline_expired():
+    with run_deadline(0):
+        assert first_completed([lambda: 1], n=1) == ([], 0)
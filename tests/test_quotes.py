@@ -0,0 +1,188 @@
+"""
+Tests for the live quote ring buffers and ingestion service, run against the
+local simulated feed.
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.shared import quotes
+from src.shared.quotes import (
+    MARKET_TIMEZONE,
+    QuoteIngestionService,
+    QuoteRingBuffer,
+    SimulatedQuoteFeed,
+    YahooQuoteFeed,
+    create_quote_feed,
+    live_metrics,
+)
+
+
+def market_time(day: int, hour: int, minute: int = 0) -> float:
+    return datetime(2026, 10, day, hour, minute, tzinfo=MARKET_TIMEZONE).timestamp()
+
+
+def test_ring_buffer_wraps_around_oldest_first():
+    buffer = QuoteRingBuffer(capacity=4)
+    assert buffer.latest() is None
+
+    for i in range(6):
+        buffer.append(float(i), 100.0 + i)
+
+    timestamps, prices = buffer.window()
+    assert len(buffer) == 4
+    assert timestamps.tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert prices.tolist() == [102.0, 103.0, 104.0, 105.0]
+    assert buffer.latest() == (5.0, 105.0)
+
+
+def test_ring_buffer_window_before_full():
+    buffer = QuoteRingBuffer(capacity=4)
+    buffer.append(1.0, 10.0)
+    buffer.append(2.0, 11.0)
+
+    timestamps, prices = buffer.window()
+    assert timestamps.tolist() == [1.0, 2.0]
+    assert prices.tolist() == [10.0, 11.0]
+
+
+def test_intraday_only_uses_latest_trading_day():
+    buffer = QuoteRingBuffer(capacity=8)
+    # Previous day's quotes must not count towards today's return
+    buffer.append(market_time(15, 15, 59), 50.0)
+    buffer.append(market_time(16, 9, 30), 100.0)
+    buffer.append(market_time(16, 10, 0), 110.0)
+    buffer.append(market_time(16, 10, 30), 99.0)
+
+    metrics = buffer.intraday()
+    log_returns = np.diff(np.log([100.0, 110.0, 99.0]))
+
+    assert metrics["price"] == 99.0
+    assert metrics["first_price"] == 100.0
+    assert metrics["return_since_first_pct"] == pytest.approx(-1.0)
+    assert metrics["realized_volatility_pct"] == pytest.approx(np.sqrt(np.sum(log_returns ** 2)) * 100)
+
+
+def test_intraday_needs_two_samples_in_the_day():
+    buffer = QuoteRingBuffer(capacity=4)
+    buffer.append(market_time(15, 15, 59), 50.0)
+    buffer.append(market_time(16, 9, 30), 100.0)
+
+    assert buffer.intraday() is None
+
+
+def test_poll_once_with_seeded_simulated_feed():
+    service = QuoteIngestionService(
+        feed=SimulatedQuoteFeed({"AAPL": 190.0}, seed=7), interval=60, capacity=16)
+    service.subscribe(["aapl", "msft"])
+
+    for _ in range(3):
+        service.poll_once()
+
+    expected = SimulatedQuoteFeed({"AAPL": 190.0}, seed=7)
+    for _ in range(3):
+        quotes = expected.fetch(["AAPL", "MSFT"])
+
+    assert len(service.buffer("AAPL")) == 3
+    assert service.buffer("AAPL").latest()[1] == pytest.approx(quotes["AAPL"][1])
+    assert service.buffer("MSFT").latest()[1] == pytest.approx(quotes["MSFT"][1])
+
+
+def test_unsubscribed_tickers_are_not_buffered():
+    service = QuoteIngestionService(feed=SimulatedQuoteFeed(seed=1), interval=60, capacity=4)
+    service.subscribe(["AAPL"])
+    service.unsubscribe(["aapl"])
+    service.poll_once()
+
+    assert service.buffer("AAPL") is None
+    assert service.watchlist() == []
+
+
+class FixedBarFeed:
+    """
+    Feed that keeps returning the same bar, like Yahoo Finance after the close
+    """
+
+    def fetch(self, tickers):
+        return {ticker: (market_time(16, 15, 59), 100.0) for ticker in tickers}
+
+
+def test_poll_once_skips_bars_already_buffered():
+    service = QuoteIngestionService(feed=FixedBarFeed(), interval=60, capacity=8)
+    service.subscribe(["AAPL"])
+
+    for _ in range(3):
+        service.poll_once()
+
+    assert len(service.buffer("AAPL")) == 1
+
+
+def test_yahoo_feed_uses_bar_timestamps(monkeypatch):
+    bars = pd.date_range("2026-10-16 15:57", periods=3, freq="1min", tz=MARKET_TIMEZONE)
+    columns = pd.MultiIndex.from_product([["Close", "Volume"], ["AAPL", "MSFT"]])
+    data = pd.DataFrame(
+        [[100.0, 400.0, 1, 1], [101.0, 401.0, 1, 1], [102.0, np.nan, 1, 1]],
+        index=bars, columns=columns)
+    monkeypatch.setattr(quotes.yf, "download", lambda *args, **kwargs: data)
+
+    fetched = YahooQuoteFeed(timeout=1).fetch(["AAPL", "MSFT", "NVDA"])
+
+    assert fetched == {
+        "AAPL": (bars[2].timestamp(), 102.0),
+        "MSFT": (bars[1].timestamp(), 401.0),
+    }
+
+
+class StaleFeed:
+    """
+    Feed whose quotes are already older than the freshness cutoff
+    """
+
+    def fetch(self, tickers):
+        return {ticker: (time.time() - 60, 100.0) for ticker in tickers}
+
+
+def wait_for_quote(service, ticker):
+    for _ in range(100):
+        if len(service.buffer(ticker)):
+            return
+        time.sleep(0.01)
+    pytest.fail("Quote service never polled")
+
+
+def test_live_metrics_uses_fresh_quotes_from_running_service():
+    service = QuoteIngestionService(feed=SimulatedQuoteFeed({"AAPL": 190.0}, seed=3), interval=5, capacity=8)
+    service.subscribe(["AAPL"])
+    assert live_metrics("AAPL", service) is None
+
+    service.start()
+    try:
+        wait_for_quote(service, "AAPL")
+        metrics = live_metrics("AAPL", service)
+    finally:
+        service.stop()
+
+    assert metrics == {"price": service.buffer("AAPL").latest()[1]}
+    assert live_metrics("AAPL", service) is None
+    assert live_metrics("MSFT", service) is None
+
+
+def test_live_metrics_ignores_stale_quotes():
+    service = QuoteIngestionService(feed=StaleFeed(), interval=5, capacity=8, max_age=30)
+    service.subscribe(["AAPL"])
+    service.start()
+    try:
+        wait_for_quote(service, "AAPL")
+        assert live_metrics("AAPL", service) is None
+    finally:
+        service.stop()
+
+
+def test_create_quote_feed():
+    assert isinstance(create_quote_feed("simulated"), SimulatedQuoteFeed)
+    with pytest.raises(ValueError):
+        create_quote_feed("bloomberg")